@@ -6,6 +6,7 @@ It also generates a bar chart of the top Drug Classes using Plotly Express.
 
 Dependencies:
 - pandas
+- pyarrow (TSV parsing, Arrow-backed dtypes and string kernels)
 - plotly
 
 Usage:
@@ -13,106 +14,174 @@ Usage:
 
 """
 
+from collections import Counter
+
 import pandas as pd
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from data_io import read_tsv
 
 # File paths
 ARO_INDEX_PATH = 'data/aro_index.tsv'
 
-def merge_card():
+# Columns used by the analyses below
+SELECTED_COLS = [
+    'ARO Accession',
+    'Drug Class',
+    'Resistance Mechanism',
+    'Protein Accession'
+]
+
+# Semicolon-separated columns, kept Arrow-backed so split/strip run in Arrow's C++ kernels
+MULTI_VALUE_COLS = ['Drug Class', 'Resistance Mechanism']
+
+def load_aro_index(path=ARO_INDEX_PATH):
+    """
+    Parses 'aro_index.tsv' once, keeping only SELECTED_COLS.
+    Unused columns are dropped before conversion to pandas; selected columns the
+    file lacks are skipped.
+    Args:
+        path (str): Path to the TSV file.
+    Returns:
+        pd.DataFrame: DataFrame with the selected columns as Arrow-backed strings.
+    """
+    return read_tsv(path, columns=SELECTED_COLS, ignore_missing_columns=True)
+
+def merge_card(aro_index_df=None):
     """
-    Loads 'aro_index.tsv' and returns a DataFrame with the following columns:
+    Returns a DataFrame of 'aro_index.tsv' with the following columns:
         - 'ARO Accession'
         - 'Drug Class'
         - 'Resistance Mechanism'
         - 'Protein Accession'
+    Args:
+        aro_index_df (pd.DataFrame, optional): Already loaded aro_index data.
+            Loaded from ARO_INDEX_PATH when omitted.
     Returns:
         pd.DataFrame: DataFrame with selected columns.
     """
-    aro_index_df = pd.read_csv(ARO_INDEX_PATH, sep='\t')
-    selected_cols = [
-        'ARO Accession',
-        'Drug Class',
-        'Resistance Mechanism',
-        'Protein Accession'
-    ]
+    if aro_index_df is None:
+        aro_index_df = load_aro_index()
     # Only keep columns that exist in the DataFrame
-    selected_cols = [col for col in selected_cols if col in aro_index_df.columns]
-    return aro_index_df[selected_cols]
+    selected_cols = [col for col in SELECTED_COLS if col in aro_index_df.columns]
+    arrow_string = pd.ArrowDtype(pa.string())
+    return aro_index_df[selected_cols].astype(
+        {col: arrow_string for col in MULTI_VALUE_COLS if col in selected_cols}
+    )
+
+def split_multi_value(df):
+    """
+    Splits the semicolon-separated MULTI_VALUE_COLS into lists of trimmed values.
+    Done once so the top-N helpers and the combined plot share the same work.
+    Args:
+        df (pd.DataFrame): DataFrame from merge_card.
+    Returns:
+        pd.DataFrame: Copy of df where each MULTI_VALUE_COLS column holds Arrow lists of strings.
+    """
+    split_cols = {}
+    for col in [col for col in MULTI_VALUE_COLS if col in df.columns]:
+        values = pa.array(df[col], type=pa.string())
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        # Split on the literal ';' (no regex engine), then trim the flat token buffer
+        # and reattach it to the list offsets
+        lists = pc.split_pattern(values, ';')
+        lists = pa.ListArray.from_arrays(
+            lists.offsets, pc.utf8_trim_whitespace(lists.values), mask=lists.is_null()
+        )
+        split_cols[col] = pd.Series(pd.arrays.ArrowExtensionArray(lists), index=df.index)
+    return df.assign(**split_cols)
+
+def _count_tokens(series):
+    """
+    Counts the values of a column produced by split_multi_value.
+    Tokens are hashed and counted by Arrow in C++; only the unique values
+    are converted to Python objects.
+    Args:
+        series (pd.Series): Column of lists of strings.
+    Returns:
+        Counter: Occurrences of each value.
+    """
+    counts = pc.value_counts(pc.list_flatten(pa.array(series)))
+    return Counter(dict(zip(counts.field('values').to_pylist(), counts.field('counts').to_pylist())))
 
 def top_drug_classes(df, n=10):
     """
     Returns a DataFrame of the n most frequent Drug Class values, sorted descending.
-    Handles semicolon-separated values.
+    Counter.most_common(n) selects them with a heap instead of sorting every value.
     Args:
-        df (pd.DataFrame): DataFrame containing a 'Drug Class' column.
+        df (pd.DataFrame): Output of split_multi_value containing a 'Drug Class' column.
         n (int): Number of top drug classes to return.
     Returns:
         pd.DataFrame: DataFrame with columns 'Drug Class' and 'count'.
     """
     if 'Drug Class' not in df.columns:
         raise ValueError("Input DataFrame must contain a 'Drug Class' column.")
-    # Split semicolon-separated values and explode the DataFrame
-    split_df = df.assign(**{'Drug Class': df['Drug Class'].str.split(';')})
-    exploded_df = split_df.explode('Drug Class')
-    # Trim whitespace
-    exploded_df['Drug Class'] = exploded_df['Drug Class'].str.strip()
-    counts = exploded_df['Drug Class'].value_counts().reset_index()
-    counts.columns = ['Drug Class', 'count']
-    return counts.head(n)
+    counts = _count_tokens(df['Drug Class'])
+    return pd.DataFrame(counts.most_common(n), columns=['Drug Class', 'count'])
 
 def top_resistance_mechanisms(df, n=10):
     """
     Returns a DataFrame of the n most frequent Resistance Mechanism values, sorted descending.
-    Handles semicolon-separated values.
+    Counter.most_common(n) selects them with a heap instead of sorting every value.
     Args:
-        df (pd.DataFrame): DataFrame containing a 'Resistance Mechanism' column.
+        df (pd.DataFrame): Output of split_multi_value containing a 'Resistance Mechanism' column.
         n (int): Number of top resistance mechanisms to return.
     Returns:
         pd.DataFrame: DataFrame with columns 'Resistance Mechanism' and 'count'.
     """
     if 'Resistance Mechanism' not in df.columns:
         raise ValueError("Input DataFrame must contain a 'Resistance Mechanism' column.")
-    # Split semicolon-separated values and explode the DataFrame
-    split_df = df.assign(**{'Resistance Mechanism': df['Resistance Mechanism'].str.split(';')})
-    exploded_df = split_df.explode('Resistance Mechanism')
-    # Trim whitespace
-    exploded_df['Resistance Mechanism'] = exploded_df['Resistance Mechanism'].str.strip()
-    counts = exploded_df['Resistance Mechanism'].value_counts().reset_index()
-    counts.columns = ['Resistance Mechanism', 'count']
-    return counts.head(n)
+    counts = _count_tokens(df['Resistance Mechanism'])
+    return pd.DataFrame(counts.most_common(n), columns=['Resistance Mechanism', 'count'])
 
 def plot_drug_class_resistance_mechanisms(df, top_n_drug_classes=5, top_n_mechanisms=5):
     """
     Generates a grouped bar chart showing the relationship between top drug classes
     and their most common resistance mechanisms.
+    Expects the output of split_multi_value.
     """
     if 'Drug Class' not in df.columns or 'Resistance Mechanism' not in df.columns:
         raise ValueError("Input DataFrame must contain 'Drug Class' and 'Resistance Mechanism' columns.")
 
-    # Create a clean, exploded DataFrame for both columns
-    df_exploded = df.assign(
-        **{
-            'Drug Class': df['Drug Class'].str.split(';'),
-            'Resistance Mechanism': df['Resistance Mechanism'].str.split(';')
-        }
-    ).explode('Drug Class').explode('Resistance Mechanism')
-    df_exploded['Drug Class'] = df_exploded['Drug Class'].str.strip()
-    df_exploded['Resistance Mechanism'] = df_exploded['Resistance Mechanism'].str.strip()
+    # Count each (drug class, mechanism) pair per row instead of exploding both columns,
+    # so memory grows with the number of unique pairs rather than every combination
+    pair_counts = Counter()
+    for drug_classes, mechanisms in zip(
+        pa.array(df['Drug Class']).to_pylist(),
+        pa.array(df['Resistance Mechanism']).to_pylist()
+    ):
+        if drug_classes is None or mechanisms is None:
+            continue
+        for drug_class in drug_classes:
+            for mechanism in mechanisms:
+                pair_counts[(drug_class, mechanism)] += 1
 
-    # Find top N drug classes
-    top_drug_classes_list = df_exploded['Drug Class'].value_counts().nlargest(top_n_drug_classes).index.tolist()
+    # Find top N drug classes by their total pair count
+    drug_class_counts = Counter()
+    for (drug_class, _), count in pair_counts.items():
+        drug_class_counts[drug_class] += count
+    top_drug_classes_list = [drug_class for drug_class, _ in drug_class_counts.most_common(top_n_drug_classes)]
 
-    # Filter the DataFrame to include only top drug classes
-    df_filtered = df_exploded[df_exploded['Drug Class'].isin(top_drug_classes_list)]
-
-    # Group by drug class and resistance mechanism and count occurrences
-    grouped_counts = df_filtered.groupby(['Drug Class', 'Resistance Mechanism']).size().reset_index(name='count')
+    # Keep only pairs of the top drug classes
+    grouped_counts = pd.DataFrame(
+        [
+            (drug_class, mechanism, count)
+            for (drug_class, mechanism), count in pair_counts.items()
+            if drug_class in top_drug_classes_list
+        ],
+        columns=['Drug Class', 'Resistance Mechanism', 'count']
+    )
 
-    # For each drug class, find the top N mechanisms
-    top_mechanisms_per_class = grouped_counts.groupby('Drug Class').apply(
-        lambda x: x.nlargest(top_n_mechanisms, 'count')
-    ).reset_index(drop=True)
+    # For each drug class, find the top N mechanisms with one sort and a per-group row cap.
+    # Ties keep alphabetical order.
+    top_mechanisms_per_class = grouped_counts.sort_values(
+        ['Drug Class', 'count', 'Resistance Mechanism'],
+        ascending=[True, False, True],
+        ignore_index=True
+    ).groupby('Drug Class', sort=False).head(top_n_mechanisms)
 
     # Create the plot
     fig = px.bar(
@@ -131,19 +200,23 @@ def plot_drug_class_resistance_mechanisms(df, top_n_drug_classes=5, top_n_mechan
 
 def main():
     """
-    Loads the TSV file and prints its shape.
+    Loads the selected columns of the TSV file and prints their shape.
     """
-    aro_index_df = pd.read_csv(ARO_INDEX_PATH, sep='\t')
-    print(f"aro_index.tsv shape: {aro_index_df.shape}")
+    # Parse the TSV once and reuse it for merge_card
+    aro_index_df = load_aro_index()
+    print(f"aro_index.tsv shape (selected columns): {aro_index_df.shape}")
 
     # Demonstrate merge_card usage
-    merged_df = merge_card()
+    merged_df = merge_card(aro_index_df)
     print("\nSelected DataFrame (first 5 rows):")
     print(merged_df.head())
 
+    # Split the multi-valued columns once for all of the summaries below
+    split_df = split_multi_value(merged_df)
+
     # Show top 10 most frequent Drug Class values
     print("\nTop 10 Drug Classes (Corrected):")
-    top_dc_df = top_drug_classes(merged_df, n=10)
+    top_dc_df = top_drug_classes(split_df, n=10)
     print(top_dc_df)
 
     # Generate a bar chart of the top Drug Classes
@@ -160,7 +233,7 @@ def main():
 
     # Show top 10 most frequent Resistance Mechanism values
     print("\nTop 10 Resistance Mechanisms:")
-    top_rm_df = top_resistance_mechanisms(merged_df, n=10)
+    top_rm_df = top_resistance_mechanisms(split_df, n=10)
     print(top_rm_df)
 
     # Generate a bar chart of the top Resistance Mechanisms
@@ -177,7 +250,7 @@ def main():
 
     # Generate the combined plot
     print("\nGenerating plot for Drug Class vs. Resistance Mechanism...")
-    plot_drug_class_resistance_mechanisms(merged_df)
+    plot_drug_class_resistance_mechanisms(split_df)
 
 
 if __name__ == "__main__":
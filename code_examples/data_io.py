@@ -0,0 +1,90 @@
+"""
+data_io.py
+
+Shared TSV loading for the analysis scripts in this directory.
+Files are parsed with the PyArrow CSV reader, which tokenizes on multiple
+threads and produces columnar data, instead of pandas' single-threaded parser.
+Columns come back as Arrow-backed pandas dtypes so string operations stay in
+Arrow's C++ kernels.
+
+Parsed tables are cached twice:
+- in memory per process (functools.lru_cache), so repeated loads are free;
+- on disk as a '<file>.parquet' sidecar next to the source file ('<file>.skip.parquet'
+  for reads with skip_invalid_rows), reused by later runs while it is newer than
+  the source. Delete it to force a re-parse.
+
+Dependencies:
+- pandas
+- pyarrow
+
+Usage:
+    from data_io import read_tsv
+    df = read_tsv('data/aro_index.tsv')
+"""
+
+import functools
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+@functools.lru_cache(maxsize=None)
+def _load_table(path, skip_invalid_rows):
+    """
+    Returns the file as a pyarrow Table, from the parquet sidecar when it is
+    up to date, otherwise by parsing the TSV and writing the sidecar.
+    Tables are immutable, so the cached object is safe to share between callers.
+    Lenient reads use their own sidecar, so a strict read never sees rows dropped
+    by skip_invalid_rows.
+    Args:
+        path (str): Path to the TSV file.
+        skip_invalid_rows (bool): See read_tsv.
+    Returns:
+        pyarrow.Table: All columns of the file.
+    """
+    parquet_path = path + ('.skip.parquet' if skip_invalid_rows else '.parquet')
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+        return pq.read_table(parquet_path)
+
+    parse_options = pv.ParseOptions(
+        delimiter='\t',
+        invalid_row_handler=(lambda row: 'skip') if skip_invalid_rows else None
+    )
+    # Parse straight from the page cache instead of copying the file into a read buffer first
+    with pa.memory_map(path, 'r') as source:
+        table = pv.read_csv(
+            source,
+            read_options=pv.ReadOptions(use_threads=True),
+            parse_options=parse_options,
+            convert_options=pv.ConvertOptions(strings_can_be_null=True)
+        )
+    try:
+        pq.write_table(table, parquet_path)
+    except OSError as e:
+        # Caching is an optimization only; a read-only data directory is fine
+        print(f"Could not write parquet cache '{parquet_path}': {e}")
+    return table
+
+def read_tsv(path, columns=None, skip_invalid_rows=False, ignore_missing_columns=False):
+    """
+    Loads a tab-separated file into a DataFrame using the PyArrow CSV reader.
+    Empty fields are read as missing values, matching pd.read_csv.
+    Repeated loads of the same file are served from the caches described above.
+    Args:
+        path (str): Path to the TSV file.
+        columns (list, optional): Columns to keep. All columns when omitted.
+        skip_invalid_rows (bool): Drop rows whose field count does not match the header
+            instead of raising.
+        ignore_missing_columns (bool): Leave out requested columns the file does not have
+            instead of raising.
+    Returns:
+        pd.DataFrame: DataFrame with Arrow-backed (pd.ArrowDtype) columns.
+    """
+    table = _load_table(path, skip_invalid_rows)
+    if columns is not None:
+        if ignore_missing_columns:
+            columns = [col for col in columns if col in table.column_names]
+        table = table.select(columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -7,26 +7,77 @@ quick overview of each file. It lists all files and attempts to read and
 print the first few lines of each to help understand their structure and content.
 
 This is useful for debugging and initial data exploration.
+Files are previewed concurrently with a thread pool since each preview is
+IO-bound; output is still printed in file name order.
 
 Usage:
     uv run debug_data_files.py
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import pandas as pd
 
 # Directory path
 DATA_DIR = 'data/'
 
+# Number of files previewed concurrently; previews are IO-bound
+MAX_WORKERS = 8
+
+def preview_file(file_path):
+    """
+    Builds a preview of a single file's content.
+    Args:
+        file_path (str): Path to the file.
+    Returns:
+        str: Formatted preview, ready to print.
+    """
+    filename = os.path.basename(file_path)
+    lines = [f"\n{'='*50}", f"File: {filename}", f"{'='*50}"]
+
+    try:
+        # Handle different file types for preview
+        if filename.endswith('.tsv'):
+            # Read only the header and first 5 rows; pandas is used just for display
+            with open(file_path, 'r', encoding='utf-8') as f:
+                header, *rows = [line.rstrip('\n').split('\t') for line in islice(f, 6)]
+            # Rows with trailing empty fields come back short; zip pads them with NaN
+            df = pd.DataFrame([dict(zip(header, row)) for row in rows], columns=header)
+            lines.append("File Type: TSV (first 5 rows shown)")
+            lines.append(str(df))
+        elif filename.endswith(('.fasta', '.txt', '.json')):
+            # Preview other text-based files by reading the first few lines
+            lines.append(f"File Type: {filename.split('.')[-1].upper()} (first 5 lines shown)")
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines.extend(line.strip() for line in islice(f, 5))
+        elif filename.endswith('.tar.bz2'):
+            lines.append("File Type: Compressed Archive (tar.bz2)")
+            lines.append("Content preview is not available for compressed files.")
+        else:
+            lines.append("File Type: Other/Binary")
+            lines.append("Content preview is not available for this file type.")
+
+    except Exception as e:
+        lines.append(f"Could not read or preview file. Reason: {e}")
+
+    return '\n'.join(lines)
+
 def preview_files_in_directory(directory):
     """
     Lists all files in a directory and prints a preview of their content.
+    Files are read concurrently; previews are printed in file name order.
     """
     print(f"--- Exploring files in '{directory}' directory ---")
     
     try:
         # Get the list of files
-        files = sorted([f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))])
+        # Parquet files are caches written by data_io.read_tsv, not source data
+        files = sorted([
+            f for f in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, f)) and not f.endswith('.parquet')
+        ])
     except FileNotFoundError:
         print(f"Error: Directory not found at '{directory}'")
         return
@@ -35,36 +86,10 @@ def preview_files_in_directory(directory):
         print("No files found in the directory.")
         return
 
-    for filename in files:
-        file_path = os.path.join(directory, filename)
-        print(f"\n{'='*50}")
-        print(f"File: {filename}")
-        print(f"{'='*50}")
-        
-        try:
-            # Handle different file types for preview
-            if filename.endswith('.tsv'):
-                # Preview TSV using pandas for a nice format
-                df = pd.read_csv(file_path, sep='\t', nrows=5)
-                print("File Type: TSV (first 5 rows shown)")
-                print(df)
-            elif filename.endswith(('.fasta', '.txt', '.json')):
-                # Preview other text-based files by reading the first few lines
-                print(f"File Type: {filename.split('.')[-1].upper()} (first 5 lines shown)")
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f):
-                        if i >= 5:
-                            break
-                        print(line.strip())
-            elif filename.endswith('.tar.bz2'):
-                print("File Type: Compressed Archive (tar.bz2)")
-                print("Content preview is not available for compressed files.")
-            else:
-                print("File Type: Other/Binary")
-                print("Content preview is not available for this file type.")
-
-        except Exception as e:
-            print(f"Could not read or preview file. Reason: {e}")
+    file_paths = [os.path.join(directory, filename) for filename in files]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for preview in executor.map(preview_file, file_paths):
+            print(preview)
 
 if __name__ == "__main__":
     preview_files_in_directory(DATA_DIR)
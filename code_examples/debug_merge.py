@@ -7,9 +7,11 @@ is only returning 1 row instead of thousands.
 
 import pandas as pd
 
+from data_io import read_tsv
+
 # Load the files
-aro_index_df = pd.read_csv('data/aro_index.tsv', sep='\t')
-aro_categories_df = pd.read_csv('data/aro_categories.tsv', sep='\t')
+aro_index_df = read_tsv('data/aro_index.tsv')
+aro_categories_df = read_tsv('data/aro_categories.tsv')
 
 print("aro_index.tsv shape:", aro_index_df.shape)
 print("aro_categories.tsv shape:", aro_categories_df.shape)
@@ -27,9 +29,9 @@ print(aro_categories_df['ARO Accession'].head())
 print(f"\nUnique ARO Accessions in aro_index.tsv: {aro_index_df['ARO Accession'].nunique()}")
 print(f"Unique ARO Accessions in aro_categories.tsv: {aro_categories_df['ARO Accession'].nunique()}")
 
-# Check overlap
-aro_index_accessions = set(aro_index_df['ARO Accession'])
-aro_categories_accessions = set(aro_categories_df['ARO Accession'])
+# Check overlap (Index.intersection hashes the Arrow-backed strings in C, no Python sets)
+aro_index_accessions = pd.Index(aro_index_df['ARO Accession'])
+aro_categories_accessions = pd.Index(aro_categories_df['ARO Accession'])
 
 overlap = aro_index_accessions.intersection(aro_categories_accessions)
 print(f"\nOverlap between files: {len(overlap)}")
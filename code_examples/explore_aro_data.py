@@ -3,15 +3,15 @@ explore_aro_data.py
 
 This script provides an initial exploration of the data in 'aro_index.tsv' and 'aro_categories.tsv'.
 It loads each file as a pandas DataFrame and prints:
-- Shape (rows, columns)
-- Column names and data types
+- Shape (rows, columns) and memory usage
+- Column names
+- Per-column summary: data type, non-null, missing and distinct counts
 - First 5 rows (head)
-- DataFrame info (including nulls and dtypes)
-- Descriptive statistics (where appropriate)
-- Missing value counts per column
+- Descriptive statistics for numeric columns
 
 Dependencies:
 - pandas
+- pyarrow (TSV parsing and column summaries)
 
 Usage:
     uv run explore_aro_data.py
@@ -20,6 +20,10 @@ Author: (your name here)
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from data_io import read_tsv
 
 # File paths
 ARO_INDEX_PATH = 'data/aro_index.tsv'
@@ -33,19 +37,29 @@ def explore_file(path, name):
         name (str): Descriptive name for the file.
     """
     print(f"\n{'='*40}\nExploring {name}\n{'='*40}")
-    df = pd.read_csv(path, sep='\t')
+    df = read_tsv(path)
     print(f"Shape: {df.shape}")
     print(f"Columns: {list(df.columns)}")
-    print("\nData types:")
-    print(df.dtypes)
-    print("\nInfo:")
-    df.info()
+
+    # One pass over the Arrow columns replaces separate dtypes/info/isnull/describe scans
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    print(f"Memory usage: {table.nbytes / 1024:.1f} KB")
+    print("\nColumn summary:")
+    print(pd.DataFrame(
+        [
+            (str(column.type), pc.count(column).as_py(), column.null_count, pc.count_distinct(column).as_py())
+            for column in table.columns
+        ],
+        columns=['dtype', 'non-null', 'missing', 'unique'],
+        index=table.column_names
+    ))
+
     print("\nFirst 5 rows:")
     print(df.head())
-    print("\nDescriptive statistics:")
-    print(df.describe(include='all', datetime_is_numeric=True))
-    print("\nMissing values per column:")
-    print(df.isnull().sum())
+    numeric_df = df.select_dtypes('number')
+    if not numeric_df.empty:
+        print("\nDescriptive statistics:")
+        print(numeric_df.describe())
 
 if __name__ == "__main__":
     explore_file(ARO_INDEX_PATH, 'ARO Index')
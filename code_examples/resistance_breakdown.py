@@ -15,6 +15,7 @@ It performs the following steps:
 
 Dependencies:
 - pandas
+- pyarrow (TSV parsing and string kernels)
 - plotly
 
 Usage:
@@ -23,6 +24,10 @@ Usage:
 
 import pandas as pd
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from data_io import read_tsv
 
 # File paths
 ARO_INDEX_PATH = 'data/aro_index.tsv'
@@ -42,7 +47,7 @@ def analyze_resistance_breakdown(aro_df, snp_df, drug_class):
     """
     # --- 1. Process ARO Index Data ---
     # Handle multi-valued 'Drug Class' column
-    aro_df_exploded = aro_df.assign(**{'Drug Class': aro_df['Drug Class'].str.split(';')}).explode('Drug Class')
+    aro_df_exploded = aro_df.assign(**{'Drug Class': aro_df['Drug Class'].str.split(';', regex=False)}).explode('Drug Class')
     aro_df_exploded['Drug Class'] = aro_df_exploded['Drug Class'].str.strip()
     
     # Filter for the specified drug class
@@ -55,16 +60,19 @@ def analyze_resistance_breakdown(aro_df, snp_df, drug_class):
     total_resistance_determinants = drug_class_df['ARO Accession'].nunique()
     
     # --- 2. Process SNP Data ---
-    # Get unique ARO accessions from the SNP data
+    # Get ARO accessions from the SNP data
     # The 'Accession' column in snps.txt is just the number, so we prepend 'ARO:'
-    snp_aro_accessions = set('ARO:' + snp_df['Accession'].astype(str))
+    # binary_join_element_wise builds all prefixed strings in one Arrow kernel call
+    snp_accessions = pc.cast(pa.array(snp_df['Accession']), pa.string())
+    snp_aro_accessions = pd.arrays.ArrowExtensionArray(
+        pc.binary_join_element_wise('ARO:', snp_accessions, '')
+    )
     
     # --- 3. Correlate Data ---
-    # Find which of the drug class determinants are SNP-based
-    drug_class_aro_accessions = set(drug_class_df['ARO Accession'])
-    snp_based_accessions = drug_class_aro_accessions.intersection(snp_aro_accessions)
+    # Find which of the drug class determinants are SNP-based (isin hashes in C, not Python sets)
+    is_snp_based = drug_class_df['ARO Accession'].isin(snp_aro_accessions)
     
-    snp_count = len(snp_based_accessions)
+    snp_count = drug_class_df.loc[is_snp_based, 'ARO Accession'].nunique()
     gene_count = total_resistance_determinants - snp_count
     
     # --- 4. Prepare DataFrame for plotting ---
@@ -103,24 +111,11 @@ def main():
     Main function to load data and run the analysis.
     """
     try:
-        aro_df = pd.read_csv(ARO_INDEX_PATH, sep='\t')
-        
-        # The snps.txt file has a complex, irregular format.
-        # We only need the first column (Accession), so we'll parse it manually
-        # to avoid the errors caused by the inconsistent structure.
-        snp_accessions = []
-        with open(SNPS_PATH, 'r') as f:
-            # Skip the two header lines
-            next(f)
-            next(f)
-            for line in f:
-                # Split by whitespace and take the first element
-                parts = line.strip().split()
-                if parts:
-                    snp_accessions.append(parts[0])
+        aro_df = read_tsv(ARO_INDEX_PATH)
         
-        # Create a DataFrame from the extracted accessions
-        snp_df = pd.DataFrame(snp_accessions, columns=['Accession'])
+        # The snps.txt file can contain irregular rows.
+        # We only need the Accession column, so malformed rows are skipped by the reader.
+        snp_df = read_tsv(SNPS_PATH, columns=['Accession'], skip_invalid_rows=True)
 
     except FileNotFoundError as e:
         print(f"Error: Could not find a required data file. {e}")
@@ -14,15 +14,17 @@ It performs the following steps:
 
 Dependencies:
 - pandas
+- pyarrow (TSV parsing, see data_io.py)
 - plotly
 
 Usage:
     uv run snp_analyzer.py
 """
 
-import pandas as pd
 import plotly.express as px
 
+from data_io import read_tsv
+
 # File path
 SNPS_PATH = 'data/snps.txt'
 
@@ -40,7 +42,7 @@ def analyze_snp_data(file_path):
     """
     try:
         # Load the data using tab as a separator
-        df = pd.read_csv(file_path, sep='\t')
+        df = read_tsv(file_path)
         
         # Check if the required column exists
         if 'CARD Short Name' not in df.columns: